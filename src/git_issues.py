@@ -14,18 +14,50 @@ issue dictionaries.  The structure mimics the payload returned by the GitHub
 REST API, which means that only a small subset of keys is required (``number``
 or ``id`` and ``state``/``status``).  The functions are deliberately defensive
 so the tests can feed in minimal stubs without needing network access.
+
+Every free function resolves issues by scanning the sequence.  Long-lived
+callers that repeatedly update the same list should wrap it in an
+:class:`IssueStore`, which keeps a number index across operations.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable, MutableMapping, MutableSequence
-from typing import Any, Dict, List, Optional
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional
+
+# States that mean an issue no longer needs any work.
+_CLOSED_STATES: FrozenSet[str] = frozenset({"closed", "completed", "done", "resolved"})
+
+# Already-normalised states, returned by ``_get_state`` without normalisation.
+_CANONICAL_STATES: FrozenSet[str] = _CLOSED_STATES | {"open", "in_progress"}
+
+# Fallback keys used by non-GitHub dumps when ``number`` is missing.
+_IDENTIFIER_ALIASES = ("id", "issue_id", "issueNumber")
+
+_MISSING = object()
 
 
 class IssueNotFoundError(LookupError):
     """Raised when the requested issue identifier cannot be located."""
 
 
+@dataclass(slots=True)
+class IssueRecord:
+    """Compact, slotted representation of an issue for internal hot loops.
+
+    Only the fields the helpers reason about are stored as attributes; any
+    other payload keys are kept in ``extras``.  Use :func:`to_record` and
+    :func:`from_record` to convert from/to the dictionary payload.
+    """
+
+    number: int
+    state: str = "open"
+    completed: bool = False
+    extras: Optional[Dict[str, Any]] = None
+
+
 def _ensure_mutable_issue(
     issues: MutableSequence[MutableMapping[str, Any]], index: int
 ) -> MutableMapping[str, Any]:
@@ -37,7 +69,8 @@ def _ensure_mutable_issue(
     """
 
     issue = issues[index]
-    if isinstance(issue, MutableMapping):
+    # Plain dicts are by far the common case; skip the ABC check for them.
+    if type(issue) is dict or isinstance(issue, MutableMapping):
         return issue
 
     # ``Mapping`` but not mutable.  Replace it with a mutable copy inside the
@@ -47,28 +80,67 @@ def _ensure_mutable_issue(
     return mutable_issue
 
 
+@lru_cache(maxsize=128)
+def _normalise_state_cached(value: str) -> str:
+    return value.strip().lower()
+
+
 def _normalise_state(value: Optional[Any]) -> str:
     if value is None:
         return "open"
-    return str(value).strip().lower()
+    if (
+        isinstance(value, str)
+        and value.islower()
+        and not value[0].isspace()
+        and not value[-1].isspace()
+    ):
+        # Already canonical: the common case once ``_set_state`` has run.
+        return value
+    return _normalise_state_cached(str(value))
+
+
+def _issue_identifier(issue: Mapping[str, Any]) -> int:
+    # ``number`` is what GitHub payloads carry, so probe it before the aliases.
+    value = issue.get("number", _MISSING)
+    if value is not _MISSING:
+        return int(value)
+    for key in _IDENTIFIER_ALIASES:
+        value = issue.get(key, _MISSING)
+        if value is not _MISSING:
+            return int(value)
+    raise KeyError("Issue identifier not found in payload")
 
 
-def _issue_identifier(issue: MutableMapping[str, Any]) -> int:
-    for key in ("number", "id", "issue_id", "issueNumber"):
-        if key in issue:
-            return int(issue[key])
-    raise KeyError("Issue identifier not found in payload")
+def _peek_identifier(issue: Mapping[str, Any]) -> Optional[int]:
+    """Return the issue number without mutating ``issue`` (``None`` if absent)."""
+
+    value = issue.get("number", _MISSING)
+    if value is not _MISSING:
+        return int(value)
+    for key in _IDENTIFIER_ALIASES:
+        value = issue.get(key, _MISSING)
+        if value is not _MISSING:
+            return int(value)
+    return None
 
 
 def _ensure_issue_number(issue: MutableMapping[str, Any]) -> int:
     """Return the canonical issue number and ensure the ``number`` key exists."""
 
-    identifier = _issue_identifier(issue)
-    issue.setdefault("number", identifier)
-    return identifier
+    value = issue.get("number", _MISSING)
+    if value is not _MISSING:
+        return int(value)
+    # Only payloads keyed by an alias need the ``number`` key backfilled.
+    for key in _IDENTIFIER_ALIASES:
+        value = issue.get(key, _MISSING)
+        if value is not _MISSING:
+            identifier = int(value)
+            issue.setdefault("number", identifier)
+            return identifier
+    raise KeyError("Issue identifier not found in payload")
 
 
-def _get_state(issue: MutableMapping[str, Any]) -> str:
+def _get_state(issue: Mapping[str, Any]) -> str:
     state = issue.get("state") or issue.get("status")
     if state is None:
         # GitHub marks closed issues with a boolean flag as well.  Honour it if
@@ -76,19 +148,62 @@ def _get_state(issue: MutableMapping[str, Any]) -> str:
         if issue.get("closed") or issue.get("completed"):
             return "closed"
         return "open"
+    if type(state) is str and state in _CANONICAL_STATES:
+        return state
     return _normalise_state(state)
 
 
 def _set_state(issue: MutableMapping[str, Any], state: str) -> None:
+    """Store ``state`` in the canonical ``state`` field of ``issue``.
+
+    ``state`` is the single source of truth read by :func:`_get_state`.  The
+    ``status`` alias and the ``closed`` flag are always kept in sync because
+    every public helper hands the mutated issue back to callers expecting the
+    GitHub-shaped payload.
+    """
+
     normalised = _normalise_state(state)
+    is_closed = normalised == "closed"
+    if (
+        issue.get("state") == normalised
+        and issue.get("status") == normalised
+        and issue.get("closed") is is_closed
+    ):
+        # Idempotent replays (e.g. closing an already closed issue) are no-ops.
+        return
     issue["state"] = normalised
     issue["status"] = normalised
-    issue["closed"] = normalised == "closed"
+    issue["closed"] = is_closed
+
+
+def _is_open(issue: Mapping[str, Any]) -> bool:
+    return _get_state(issue) not in _CLOSED_STATES
+
+
+def _copy_issue(issue: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """Return a shallow copy of ``issue`` that carries a ``number`` key if possible."""
+
+    # ``dict.copy`` clones the hash table directly; generic mappings are rebuilt.
+    copy = issue.copy() if type(issue) is dict else dict(issue)
+    try:
+        copy.setdefault("number", _issue_identifier(copy))
+    except KeyError:
+        pass
+    return copy
 
 
-def _is_open(issue: MutableMapping[str, Any]) -> bool:
-    state = _get_state(issue)
-    return state not in {"closed", "completed", "done", "resolved"}
+def iter_open_issues(
+    issues: Iterable[MutableMapping[str, Any]]
+) -> Iterator[MutableMapping[str, Any]]:
+    """Lazily yield the issues that are still open.
+
+    Like :func:`list_open_issues`, each yielded dictionary is a shallow copy,
+    but copies are produced one at a time so large dumps can be streamed.
+    """
+
+    for issue in issues:
+        if _is_open(issue):
+            yield _copy_issue(issue)
 
 
 def list_open_issues(
@@ -100,28 +215,48 @@ def list_open_issues(
     them without affecting the original collection.
     """
 
-    open_issues: List[MutableMapping[str, Any]] = []
-    for issue in issues:
-        if _is_open(issue):
-            copy = dict(issue)
-            try:
-                copy.setdefault("number", _issue_identifier(copy))
-            except KeyError:
-                pass
-            open_issues.append(copy)
-    return open_issues
+    return list(iter_open_issues(issues))
 
 
 def _find_issue_index(
     issues: MutableSequence[MutableMapping[str, Any]], issue_number: int
 ) -> int:
     for index, issue in enumerate(issues):
-        current_number = _ensure_issue_number(_ensure_mutable_issue(issues, index))
-        if current_number == issue_number:
+        # Only the matching entry is copied/normalised; the rest are read-only.
+        if _peek_identifier(issue) == issue_number:
+            _ensure_issue_number(_ensure_mutable_issue(issues, index))
             return index
     raise IssueNotFoundError(f"Issue #{issue_number} not found")
 
 
+def _build_index(issues: MutableSequence[MutableMapping[str, Any]]) -> Dict[int, int]:
+    """Map every issue number to its position in ``issues`` in a single pass.
+
+    Like :func:`_find_issue_index`, the first occurrence of a number wins.
+
+    The scan is read-only: entries without an identifier are skipped and no
+    issue is copied or normalised until a caller acts on it.
+    """
+
+    index_map: Dict[int, int] = {}
+    for index, issue in enumerate(issues):
+        number = _peek_identifier(issue)
+        if number is not None:
+            index_map.setdefault(number, index)
+    return index_map
+
+
+def _apply_close(
+    issues: MutableSequence[MutableMapping[str, Any]], index: int
+) -> MutableMapping[str, Any]:
+    """Close ``issues[index]`` in place and return it."""
+
+    issue = _ensure_mutable_issue(issues, index)
+    _ensure_issue_number(issue)
+    _set_state(issue, "closed")
+    return issue
+
+
 def close_issue(
     issues: MutableSequence[MutableMapping[str, Any]], issue_number: int
 ) -> MutableMapping[str, Any]:
@@ -132,11 +267,7 @@ def close_issue(
     resolved.
     """
 
-    index = _find_issue_index(issues, issue_number)
-    issue = _ensure_mutable_issue(issues, index)
-    _ensure_issue_number(issue)
-    _set_state(issue, "closed")
-    return issue
+    return _apply_close(issues, _find_issue_index(issues, issue_number))
 
 
 def complete_issue(
@@ -161,13 +292,12 @@ def close_implemented_issues(
     Unknown issue numbers are ignored to keep the operation idempotent.
     """
 
-    closed: List[MutableMapping[str, Any]] = []
-    for issue_number in implemented_issue_numbers:
-        try:
-            closed.append(close_issue(issues, issue_number))
-        except IssueNotFoundError:
-            continue
-    return closed
+    index_map = _build_index(issues)
+    return [
+        _apply_close(issues, index)
+        for index in map(index_map.get, implemented_issue_numbers)
+        if index is not None
+    ]
 
 
 def complete_open_issues(
@@ -180,15 +310,138 @@ def complete_open_issues(
     """
 
     completed: List[MutableMapping[str, Any]] = []
-    target_numbers = set(issue_numbers) if issue_numbers is not None else None
+    target_numbers: Optional[AbstractSet[int]]
+    if issue_numbers is None:
+        target_numbers = None
+    elif isinstance(issue_numbers, (set, frozenset)):
+        # Already hashed: reuse it rather than copying.
+        target_numbers = issue_numbers
+    else:
+        target_numbers = frozenset(issue_numbers)
 
-    for index, _ in enumerate(issues):
-        issue = _ensure_mutable_issue(issues, index)
-        number = _ensure_issue_number(issue)
-        if target_numbers is not None and number not in target_numbers:
+    for index, issue in enumerate(issues):
+        if target_numbers is not None and _peek_identifier(issue) not in target_numbers:
             continue
-        if _is_open(issue):
-            issue = complete_issue(issues, number)
-            completed.append(issue)
+        if _get_state(issue) in _CLOSED_STATES:
+            continue
+        # Work on the issue we already hold instead of resolving it again by
+        # number, which would rescan the whole sequence each time.  Only the
+        # issues actually completed are copied/normalised.
+        issue = _ensure_mutable_issue(issues, index)
+        _ensure_issue_number(issue)
+        _set_state(issue, "closed")
+        issue["completed"] = True
+        completed.append(issue)
     return completed
 
+
+class IssueStore:
+    """Wrap an issue sequence and keep a ``number -> index`` map up to date.
+
+    Lookups are O(1) instead of the linear scan performed by the free
+    functions.  The wrapped sequence is updated in place, so it must only be
+    grown or shrunk through :meth:`add` and :meth:`remove` while the store is in
+    use; otherwise the index goes stale.
+    """
+
+    def __init__(self, issues: MutableSequence[MutableMapping[str, Any]]) -> None:
+        self._issues = issues
+        self._index = _build_index(issues)
+
+    @property
+    def issues(self) -> MutableSequence[MutableMapping[str, Any]]:
+        return self._issues
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __contains__(self, issue_number: object) -> bool:
+        return issue_number in self._index
+
+    def _locate(self, issue_number: int) -> int:
+        index = self._index.get(issue_number)
+        if index is None:
+            raise IssueNotFoundError(f"Issue #{issue_number} not found")
+        return index
+
+    def add(self, issue: MutableMapping[str, Any]) -> None:
+        """Append ``issue`` to the wrapped sequence and index it."""
+
+        self._issues.append(issue)
+        number = _peek_identifier(issue)
+        if number is not None:
+            self._index.setdefault(number, len(self._issues) - 1)
+
+    def remove(self, issue_number: int) -> MutableMapping[str, Any]:
+        """Remove and return the issue identified by ``issue_number``."""
+
+        issue = self._issues.pop(self._locate(issue_number))
+        # Later positions shift down by one; reindex rather than patch them.
+        self._index = _build_index(self._issues)
+        return issue
+
+    def close(self, issue_number: int) -> MutableMapping[str, Any]:
+        """Same as :func:`close_issue`, without scanning the sequence."""
+
+        return _apply_close(self._issues, self._locate(issue_number))
+
+    def complete(self, issue_number: int) -> MutableMapping[str, Any]:
+        """Same as :func:`complete_issue`, without scanning the sequence."""
+
+        issue = self.close(issue_number)
+        issue["completed"] = True
+        return issue
+
+    def list_open(self) -> List[MutableMapping[str, Any]]:
+        """Same as :func:`list_open_issues`."""
+
+        return list_open_issues(self._issues)
+
+
+_RECORD_KEYS = frozenset({"number", "state", "status", "closed", "completed"})
+
+
+def to_record(issue: Mapping[str, Any]) -> IssueRecord:
+    """Convert an issue payload into an :class:`IssueRecord`."""
+
+    extras = {key: value for key, value in issue.items() if key not in _RECORD_KEYS}
+    return IssueRecord(
+        number=_issue_identifier(issue),
+        state=_get_state(issue),
+        completed=bool(issue.get("completed")),
+        extras=extras or None,
+    )
+
+
+def from_record(record: IssueRecord) -> Dict[str, Any]:
+    """Convert an :class:`IssueRecord` back into a GitHub-shaped dictionary."""
+
+    issue: Dict[str, Any] = dict(record.extras) if record.extras else {}
+    issue["number"] = record.number
+    _set_state(issue, record.state)
+    if record.completed:
+        issue["completed"] = True
+    return issue
+
+
+def close_implemented_records_bulk(
+    records: MutableSequence[IssueRecord], implemented_issue_numbers: Iterable[int]
+) -> List[IssueRecord]:
+    """Variant of :func:`close_implemented_issues` for :class:`IssueRecord`.
+
+    Records are closed in place.  As with the dictionary variant, unknown
+    numbers are ignored and the first record carrying a number wins.
+    """
+
+    index_map: Dict[int, int] = {}
+    for position, record in enumerate(records):
+        index_map.setdefault(record.number, position)
+
+    closed: List[IssueRecord] = []
+    for index in map(index_map.get, implemented_issue_numbers):
+        if index is None:
+            continue
+        record = records[index]
+        record.state = "closed"
+        closed.append(record)
+    return closed
@@ -1,12 +1,20 @@
+from types import MappingProxyType
+
 import pytest
 
 from src.git_issues import (
     IssueNotFoundError,
+    IssueRecord,
+    IssueStore,
     close_implemented_issues,
+    close_implemented_records_bulk,
     close_issue,
     complete_issue,
     complete_open_issues,
+    from_record,
+    iter_open_issues,
     list_open_issues,
+    to_record,
 )
 
 
@@ -29,6 +37,17 @@ def test_list_open_issues_returns_only_non_closed_entries():
     assert issues[1]["state"] == "open"
 
 
+def test_iter_open_issues_yields_copies_lazily():
+    issues = sample_issues()
+    open_issues = iter_open_issues(issues)
+
+    first = next(open_issues)
+    assert first["number"] == 2
+    first["state"] = "closed"
+    assert issues[1]["state"] == "open"
+    assert [issue["number"] for issue in open_issues] == [3, 4]
+
+
 def test_close_issue_updates_state_and_status_fields():
     issues = sample_issues()
     closed = close_issue(issues, 2)
@@ -45,6 +64,15 @@ def test_close_issue_raises_error_when_identifier_unknown():
         close_issue(issues, 999)
 
 
+def test_close_issue_only_copies_the_matching_read_only_issue():
+    issues = [MappingProxyType(issue) for issue in sample_issues()]
+    close_issue(issues, 3)
+
+    assert isinstance(issues[1], MappingProxyType)
+    assert isinstance(issues[2], dict)
+    assert issues[2]["state"] == "closed"
+
+
 def test_complete_issue_marks_completed_and_closes():
     issues = sample_issues()
     completed = complete_issue(issues, 3)
@@ -61,6 +89,22 @@ def test_close_implemented_issues_ignores_unknown_numbers():
     assert issues[1]["state"] == "closed"
 
 
+def test_close_implemented_issues_skips_issues_without_identifier():
+    issues = [{"title": "Untracked"}, {"number": 2, "state": "open"}]
+    closed = close_implemented_issues(issues, [2])
+
+    assert closed == [issues[1]]
+    assert "state" not in issues[0]
+
+
+def test_close_implemented_issues_only_closes_first_duplicate():
+    issues = [{"number": 7, "state": "open"}, {"number": 7, "state": "open"}]
+    closed = close_implemented_issues(issues, [7])
+
+    assert closed == [issues[0]]
+    assert issues[1]["state"] == "open"
+
+
 def test_complete_open_issues_without_argument_closes_everything():
     issues = sample_issues()
     completed = complete_open_issues(issues)
@@ -78,3 +122,84 @@ def test_complete_open_issues_with_subset_only_updates_selected():
     assert issues[2]["completed"] is True
     # Issue #2 remains open because it was not part of the explicit list.
     assert issues[1]["state"] == "open"
+
+
+@pytest.mark.parametrize("issue_numbers", [{3}, frozenset({3})])
+def test_complete_open_issues_accepts_sets_of_numbers(issue_numbers):
+    issues = sample_issues()
+    completed = complete_open_issues(issues, issue_numbers=issue_numbers)
+
+    assert [issue["number"] for issue in completed] == [3]
+    assert issues[1]["state"] == "open"
+    # The caller's set is left untouched.
+    assert issue_numbers == {3}
+
+
+def test_complete_open_issues_with_subset_leaves_other_read_only_issues_alone():
+    issues = [MappingProxyType(issue) for issue in sample_issues()]
+    complete_open_issues(issues, issue_numbers=[3])
+
+    assert isinstance(issues[1], MappingProxyType)
+    assert isinstance(issues[3], MappingProxyType)
+    assert isinstance(issues[2], dict)
+    assert issues[2]["completed"] is True
+
+
+def test_issue_store_closes_and_completes_by_number():
+    issues = sample_issues()
+    store = IssueStore(issues)
+
+    assert store.close(2) is issues[1]
+    assert issues[1]["state"] == "closed"
+    assert store.complete(4)["completed"] is True
+    assert [issue["number"] for issue in store.list_open()] == [3]
+
+    with pytest.raises(IssueNotFoundError):
+        store.close(999)
+
+
+def test_issue_store_keeps_index_in_sync_on_add_and_remove():
+    issues = sample_issues()
+    store = IssueStore(issues)
+
+    store.add({"number": 5, "state": "open"})
+    removed = store.remove(2)
+
+    assert removed["number"] == 2
+    assert 2 not in store and 5 in store
+    assert store.close(5) is issues[-1]
+    assert store.close(3) is issues[1]
+    assert len(store) == 4
+
+
+def test_issue_records_round_trip_through_payload():
+    record = to_record({"id": 3, "title": "Persist game state", "status": "OPEN"})
+
+    assert record == IssueRecord(
+        number=3, state="open", extras={"id": 3, "title": "Persist game state"}
+    )
+    assert from_record(record) == {
+        "id": 3,
+        "title": "Persist game state",
+        "number": 3,
+        "state": "open",
+        "status": "open",
+        "closed": False,
+    }
+
+
+def test_close_implemented_records_bulk_closes_matching_records():
+    records = [to_record(issue) for issue in sample_issues()]
+    closed = close_implemented_records_bulk(records, [3, 999])
+
+    assert closed == [records[2]]
+    assert records[2].state == "closed"
+    assert records[1].state == "open"
+
+
+def test_close_implemented_records_bulk_only_closes_first_duplicate():
+    records = [IssueRecord(number=7), IssueRecord(number=7)]
+    closed = close_implemented_records_bulk(records, [7])
+
+    assert closed == [records[0]]
+    assert records[1].state == "open"